@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import os
+from kernels import coerce_codes, compare_numeric_fast, load_column
 
 def compare_codes(df1, df2, column1, column2):
     """
@@ -10,24 +11,25 @@ def compare_codes(df1, df2, column1, column2):
     :param df2: Second DataFrame
     :param column1: Column name in first DataFrame
     :param column2: Column name in second DataFrame
-    :return: Set of missing codes and total count
+    :return: Index of missing codes, total missing and total codes in df1
     """
     try:
-        # Convert columns to string to handle various data types
-        codici1 = set(df1[column1].dropna().astype(str))
-        codici2 = set(df2[column2].dropna().astype(str))
+        # Deduplicate first, then coerce codes to handle various data types
+        codici1_tutti = df1[column1].dropna()
+        codici1 = coerce_codes(codici1_tutti.drop_duplicates())
+        codici2 = coerce_codes(df2[column2].dropna().drop_duplicates())
 
-        # Find missing codes
-        mancanti = codici1 - codici2
+        # Find missing codes with vectorized set operations
+        mancanti = compare_numeric_fast(codici1, codici2)
 
-        return mancanti, len(mancanti)
+        return mancanti, len(mancanti), len(codici1_tutti)
     
     except KeyError as e:
         st.error(f"Column not found: {e}")
-        return set(), 0
+        return pd.Index([]), 0, 0
     except Exception as e:
         st.error(f"An error occurred: {e}")
-        return set(), 0
+        return pd.Index([]), 0, 0
 
 def main():
     # Page configuration
@@ -98,9 +100,9 @@ def main():
             return
 
         try:
-            # Read Excel files
-            df1 = pd.read_excel(file1)
-            df2 = pd.read_excel(file2)
+            # Read Excel files, reusing earlier parses of the same upload
+            df1 = load_column(file1.getvalue(), column1)
+            df2 = load_column(file2.getvalue(), column2)
 
             # Validate columns
             if column1 not in df1.columns:
@@ -112,7 +114,7 @@ def main():
                 return
 
             # Perform comparison
-            missing_codes, total_missing = compare_codes(df1, df2, column1, column2)
+            missing_codes, total_missing, total_codes = compare_codes(df1, df2, column1, column2)
 
             # Display results
             st.subheader("Comparison Results")
@@ -122,7 +124,7 @@ def main():
             with col_metrics1:
                 st.metric(
                     label="Total Codes in First File", 
-                    value=len(df1[column1].dropna())
+                    value=total_codes
                 )
             with col_metrics2:
                 st.metric(
@@ -131,19 +133,23 @@ def main():
                 )
 
             # Detailed Results
-            if missing_codes:
+            if total_missing:
                 st.markdown("### 🔍 Missing Codes")
                 
+                # Build the results table once and reuse it below
+                missing_codes_df = pd.DataFrame({'Missing Codes': missing_codes})
+                
                 # Option to show full list or sample
                 show_full = st.checkbox("Show Full List of Missing Codes")
                 
                 if show_full:
-                    st.dataframe(pd.DataFrame(list(missing_codes), columns=['Missing Codes']))
+                    st.dataframe(missing_codes_df)
                 else:
-                    st.dataframe(pd.DataFrame(list(missing_codes)[:50], columns=['Sample of Missing Codes']))
+                    st.dataframe(missing_codes_df.head(50).rename(
+                        columns={'Missing Codes': 'Sample of Missing Codes'}
+                    ))
                 
                 # Download option
-                missing_codes_df = pd.DataFrame(list(missing_codes), columns=['Missing Codes'])
                 csv = missing_codes_df.to_csv(index=False)
                 st.download_button(
                     label="Download Missing Codes",
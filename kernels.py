@@ -0,0 +1,148 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import io
+import streamlit as st
+from numba import njit
+from pathlib import Path
+from typing import BinaryIO, Union
+
+
+@njit(cache=True)
+def setdiff_int64(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Find unique values of one integer array missing from another.
+
+    :param a: Values to look up
+    :param b: Values to look up against
+    :return: Sorted unique values of a that are not in b
+    """
+    a = np.unique(a)
+    b = np.unique(b)
+    out = np.empty_like(a)
+
+    # Merge-walk both sorted arrays, keeping values only found in a
+    i = j = k = 0
+    while i < a.size:
+        if j >= b.size or a[i] < b[j]:
+            out[k] = a[i]
+            k += 1
+            i += 1
+        elif a[i] == b[j]:
+            i += 1
+            j += 1
+        else:
+            j += 1
+    return out[:k]
+
+
+# Compile (or load from cache) on import so the first comparison is not slowed
+setdiff_int64(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64))
+
+
+def read_excel_fast(
+    path: Union[str, Path, BinaryIO], 
+    column: str
+) -> pd.DataFrame:
+    """
+    Read a single column of an Excel file with the calamine engine.
+    
+    :param path: Path or file-like object of the Excel file
+    :param column: Name of the column to read
+    :return: DataFrame holding only that column, or no columns if it is missing
+    """
+    # Rust-backed parser and only the needed column; dtypes are left to
+    # coerce_codes, since Arrow inference rejects columns mixing numbers and text
+    return pd.read_excel(
+        path,
+        engine='calamine',
+        usecols=lambda name: name == column
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=8, ttl=3600)
+def load_column(file_bytes: bytes, column: str) -> pd.DataFrame:
+    """
+    Read a single column of an uploaded Excel file, cached on its content.
+    
+    Only the most recent uploads are kept, each for at most an hour, so a
+    long-running server does not hold on to every file it has seen.
+    
+    :param file_bytes: Raw content of the uploaded file
+    :param column: Name of the column to read
+    :return: DataFrame holding only that column, or no columns if it is missing
+    """
+    return read_excel_fast(io.BytesIO(file_bytes), column)
+
+
+def coerce_codes(series: pd.Series) -> pd.Series:
+    """
+    Cast a column of codes to nullable Int64 if integral, Float64 if
+    numeric but not integral, or Arrow-backed strings otherwise.
+    
+    :param series: Column values read from Excel
+    :return: Series with Int64, Float64 or string[pyarrow] dtype
+    """
+    # Integer codes read as floats (because of blanks) stay integers
+    if pd.api.types.is_numeric_dtype(series):
+        try:
+            return series.astype('Int64')
+        except (TypeError, ValueError):
+            return series.astype('Float64')
+    return series.astype('string[pyarrow]')
+
+
+def missing_codes_arrow(a: pa.Array, b: pa.Array) -> pa.Array:
+    """
+    Find values of one Arrow array missing from another.
+    
+    :param a: Values to look up
+    :param b: Values to look up against
+    :return: Unique values of a that are not in b, in order of appearance
+    """
+    a = pc.unique(a)
+    mask = pc.invert(pc.is_in(a, value_set=pc.unique(b)))
+    return pc.filter(a, mask)
+
+
+def compare_numeric_fast(
+    s1: Union[pd.Series, pd.Index], 
+    s2: Union[pd.Series, pd.Index]
+) -> pd.Index:
+    """
+    Find values of one column of coerced codes missing from another.
+    
+    Expects the output of coerce_codes, i.e. Int64, Float64 or strings.
+    Results are sorted ascending for both dtypes, so listings and samples
+    do not depend on the column type.
+    
+    :param s1: Values to look up
+    :param s2: Values to look up against
+    :return: Sorted Index of unique values in s1 that are not in s2
+    """
+    # Compare numeric and text columns as strings
+    if pd.api.types.is_numeric_dtype(s1) != pd.api.types.is_numeric_dtype(s2):
+        s1 = s1.astype('string[pyarrow]')
+        s2 = s2.astype('string[pyarrow]')
+
+    if pd.api.types.is_numeric_dtype(s1) and pd.api.types.is_numeric_dtype(s2):
+        # Integer barcodes use the compiled merge-diff kernel
+        if pd.api.types.is_integer_dtype(s1) and pd.api.types.is_integer_dtype(s2):
+            return pd.Index(setdiff_int64(
+                np.ascontiguousarray(s1.to_numpy(), dtype=np.int64),
+                np.ascontiguousarray(s2.to_numpy(), dtype=np.int64)
+            ))
+        # Other numeric codes go through NumPy's sort-based set difference
+        a = np.unique(s1.to_numpy(dtype=np.float64))
+        b = np.unique(s2.to_numpy(dtype=np.float64))
+        return pd.Index(np.setdiff1d(a, b, assume_unique=True))
+    # Text codes stay in Arrow buffers from ingest through the diff, and
+    # are sorted to match the kernel's output
+    missing = missing_codes_arrow(
+        pa.array(s1, from_pandas=True),
+        pa.array(s2, from_pandas=True)
+    )
+    return pd.Index(pd.arrays.ArrowStringArray(
+        missing.take(pc.array_sort_indices(missing))
+    ))
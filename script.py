@@ -1,8 +1,12 @@
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import logging
-from typing import Optional, Set, Union
+from typing import BinaryIO, Optional, Union
 from pathlib import Path
+from kernels import coerce_codes, compare_numeric_fast, load_column, read_excel_fast
+
 
 class CodeComparisonTool:
     """
@@ -26,34 +30,38 @@ class CodeComparisonTool:
 
     def _load_excel_column(
         self, 
-        file_path: Union[str, Path], 
+        file_path: Union[str, Path, BinaryIO], 
         column_name: str, 
         case_sensitive: bool = False
-    ) -> Set[str]:
+    ) -> pd.Index:
         """
         Load and process a specific column from an Excel file.
         
-        :param file_path: Path to the Excel file
+        :param file_path: Path or file-like object of the Excel file
         :param column_name: Name of the column to extract
         :param case_sensitive: Whether comparison should be case-sensitive
-        :return: Set of processed column values
+        :return: Index of unique processed column values
         """
         try:
-            # Convert to Path object for better handling
-            file_path = Path(file_path)
-            
-            # Read Excel file
-            df = pd.read_excel(file_path)
+            # Read only the requested column; uploads are cached on their
+            # content so toggling options does not parse them again
+            if hasattr(file_path, 'getvalue'):
+                df = load_column(file_path.getvalue(), column_name)
+            else:
+                df = read_excel_fast(file_path, column_name)
             
             # Validate column existence
             if column_name not in df.columns:
                 raise ValueError(f"Column '{column_name}' not found in {file_path}")
             
             # Process column values
-            if case_sensitive:
-                return set(df[column_name].dropna().astype(str))
-            else:
-                return set(df[column_name].dropna().astype(str).str.lower())
+            # Deduplicate first so repeated codes are only coerced once
+            values = coerce_codes(df[column_name].dropna().drop_duplicates())
+            if not case_sensitive and pd.api.types.is_string_dtype(values):
+                # Lower-case and deduplicate in Arrow's UTF-8 buffers
+                lowered = pc.utf8_lower(pa.array(values, from_pandas=True))
+                return pd.Index(pd.arrays.ArrowStringArray(pc.unique(lowered)))
+            return pd.Index(values.array)
         
         except Exception as e:
             st.error(f"Error processing {file_path}: {e}")
@@ -68,7 +76,7 @@ class CodeComparisonTool:
         case_sensitive: bool = False,
         comparison_direction: str = 'left_to_right',
         return_missing: bool = False
-    ) -> Optional[Set[str]]:
+    ) -> Optional[pd.Index]:
         """
         Compare codes between two Excel files.
         
@@ -79,7 +87,7 @@ class CodeComparisonTool:
         :param case_sensitive: Whether comparison is case-sensitive
         :param comparison_direction: Direction of comparison
         :param return_missing: Whether to return missing codes
-        :return: Set of missing codes or None
+        :return: Index of missing codes or None
         """
         try:
             # Load codes from both files
@@ -88,10 +96,10 @@ class CodeComparisonTool:
             
             # Determine comparison direction
             if comparison_direction == 'left_to_right':
-                missing_codes = codes1 - codes2
+                missing_codes = compare_numeric_fast(codes1, codes2)
                 direction_msg = f"Values in '{file1}' missing from '{file2}'"
             elif comparison_direction == 'right_to_left':
-                missing_codes = codes2 - codes1
+                missing_codes = compare_numeric_fast(codes2, codes1)
                 direction_msg = f"Values in '{file2}' missing from '{file1}'"
             else:
                 raise ValueError("Invalid comparison direction")
@@ -193,23 +201,27 @@ def main():
             # Display results
             st.subheader("Comparison Results")
             
-            if missing_codes:
+            if len(missing_codes):
                 # Metrics
                 st.metric(label="Missing Codes", value=len(missing_codes))
                 
                 # Show missing codes
                 st.markdown("### 🔍 Missing Codes")
                 
+                # Build the results table once and reuse it below
+                missing_codes_df = pd.DataFrame({'Missing Codes': missing_codes})
+                
                 # Option to show full list or sample
                 show_full = st.checkbox("Show Full List of Missing Codes")
                 
                 if show_full:
-                    st.dataframe(pd.DataFrame(list(missing_codes), columns=['Missing Codes']))
+                    st.dataframe(missing_codes_df)
                 else:
-                    st.dataframe(pd.DataFrame(list(missing_codes)[:50], columns=['Sample of Missing Codes']))
+                    st.dataframe(missing_codes_df.head(50).rename(
+                        columns={'Missing Codes': 'Sample of Missing Codes'}
+                    ))
                 
                 # Download option
-                missing_codes_df = pd.DataFrame(list(missing_codes), columns=['Missing Codes'])
                 csv = missing_codes_df.to_csv(index=False)
                 st.download_button(
                     label="Download Missing Codes",
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+
+from kernels import coerce_codes, compare_numeric_fast, setdiff_int64
+
+
+def _int64(*values):
+    return np.array(values, dtype=np.int64)
+
+
+def test_setdiff_int64_empty_a():
+    assert setdiff_int64(_int64(), _int64(1, 2)).tolist() == []
+
+
+def test_setdiff_int64_empty_b():
+    assert setdiff_int64(_int64(3, 1, 2), _int64()).tolist() == [1, 2, 3]
+
+
+def test_setdiff_int64_all_present():
+    assert setdiff_int64(_int64(1, 2), _int64(2, 1, 3)).tolist() == []
+
+
+def test_setdiff_int64_negative_values():
+    assert setdiff_int64(_int64(-5, 0, 7), _int64(-5, 7)).tolist() == [0]
+
+
+def test_setdiff_int64_duplicates_on_both_sides():
+    a = _int64(4, 4, 1, 2, 2, 9)
+    b = _int64(2, 2, 9, 9)
+    assert setdiff_int64(a, b).tolist() == [1, 4]
+
+
+def test_setdiff_int64_matches_numpy():
+    rng = np.random.default_rng(0)
+    a = rng.integers(-1000, 1000, 5000)
+    b = rng.integers(-1000, 1000, 3000)
+    assert setdiff_int64(a, b).tolist() == np.setdiff1d(a, b).tolist()
+
+
+def test_coerce_codes_integers_with_blanks():
+    codes = coerce_codes(pd.Series([111.0, np.nan, 222.0]).dropna())
+    assert pd.api.types.is_integer_dtype(codes)
+    assert codes.tolist() == [111, 222]
+
+
+def test_coerce_codes_mixed_column_becomes_string():
+    codes = coerce_codes(pd.Series([123, 'ABC'], dtype=object))
+    assert codes.dtype == 'string[pyarrow]'
+    assert codes.tolist() == ['123', 'ABC']
+
+
+def test_coerce_codes_preserves_leading_zeros():
+    codes = coerce_codes(pd.Series(['00123', '456'], dtype=object))
+    assert codes.tolist() == ['00123', '456']
+
+
+def test_coerce_codes_non_integral_stays_numeric():
+    codes = coerce_codes(pd.Series([2.0, 1.5]))
+    assert codes.dtype == 'Float64'
+
+
+def test_compare_numeric_fast_float_against_int():
+    missing = compare_numeric_fast(
+        coerce_codes(pd.Series([2.0, 1.5])),
+        coerce_codes(pd.Series([2, 3]))
+    )
+    assert missing.tolist() == [1.5]
+
+
+def test_compare_numeric_fast_int_against_text():
+    missing = compare_numeric_fast(
+        coerce_codes(pd.Series([123, 456])),
+        coerce_codes(pd.Series(['123', 'ABC'], dtype=object))
+    )
+    assert missing.tolist() == ['456']